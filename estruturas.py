@@ -16,6 +16,7 @@ class LinkedList:
     """
     def __init__(self):
         self.head = None
+        self.tail = None  # Ponteiro para o último nó (inserção no final em O(1))
         self.count = 0
 
     def append(self, data):
@@ -24,12 +25,21 @@ class LinkedList:
         if self.head is None:
             self.head = new_node
         else:
-            current = self.head
-            while current.next:
-                current = current.next
-            current.next = new_node
+            self.tail.next = new_node
+        self.tail = new_node
         self.count += 1
 
+    def pop_front(self):
+        """Remove e retorna o primeiro elemento da lista (uso como fila FIFO)."""
+        if self.head is None:
+            return None
+        node = self.head
+        self.head = node.next
+        if self.head is None:
+            self.tail = None
+        self.count -= 1
+        return node.data
+
     def __len__(self):
         """Retorna o número de elementos na lista."""
         return self.count
@@ -41,6 +51,16 @@ class LinkedList:
             yield current.data
             current = current.next
 
+    def iter_after(self, node):
+        """
+        Itera sobre os elementos posteriores ao nó informado.
+        Se o nó for None, itera sobre a lista inteira.
+        """
+        current = self.head if node is None else node.next
+        while current:
+            yield current.data
+            current = current.next
+
     def is_empty(self):
         """Verifica se a lista está vazia."""
         return self.head is None
@@ -1,12 +1,56 @@
 # --- START OF FILE gerenciador_dados.py ---
 
+import codecs
 import json
 import os
+import re
 import time
 
 from estruturas import LinkedList
 from modelo import Mission, DataPoint, Drone
 
+def data_point_to_dict(point: DataPoint):
+    """Converte um DataPoint para um dicionário serializável."""
+    return {
+        "telemetry": point.telemetry,
+        "environment": point.environment,
+        "timestamp": point.timestamp
+    }
+
+def dict_to_data_point(point_dict: dict):
+    """Recria um DataPoint a partir de um dicionário (do JSON)."""
+    dp = DataPoint(point_dict['telemetry'], point_dict['environment'])
+    dp.timestamp = point_dict['timestamp']
+    return dp
+
+def drone_to_dict(drone: Drone):
+    """Converte o estado atual do drone para um dicionário serializável."""
+    return {
+        "x": drone.x,
+        "y": drone.y,
+        "altitude": drone.altitude,
+        "speed": drone.speed,
+        "wind_direction": drone.wind_direction,
+        "battery": drone.battery,
+        "ambient_temperature": drone.ambient_temperature,
+        "payload_status": drone.payload_status,
+        "camera_status": drone.camera_status,
+        "photos_taken": drone.photos_taken
+    }
+
+def dict_to_drone(drone_dict: dict):
+    """Recria um Drone a partir de um dicionário (do JSON)."""
+    drone = Drone(drone_dict['x'], drone_dict['y'])
+    drone.altitude = drone_dict['altitude']
+    drone.speed = drone_dict['speed']
+    drone.wind_direction = drone_dict['wind_direction']
+    drone.battery = drone_dict['battery']
+    drone.ambient_temperature = drone_dict['ambient_temperature']
+    drone.payload_status = drone_dict['payload_status']
+    drone.camera_status = drone_dict['camera_status']
+    drone.photos_taken = drone_dict['photos_taken']
+    return drone
+
 def missions_to_dict_list(missions_linked_list: LinkedList):
     """Converte uma LinkedList de Missões para uma lista de dicionários serializáveis."""
     output_list = []
@@ -14,11 +58,7 @@ def missions_to_dict_list(missions_linked_list: LinkedList):
         # Converte o caminho de voo (LinkedList de DataPoints) para uma lista de dicionários
         flight_path_list = []
         for point in mission.flight_path:
-            flight_path_list.append({
-                "telemetry": point.telemetry,
-                "environment": point.environment,
-                "timestamp": point.timestamp
-            })
+            flight_path_list.append(data_point_to_dict(point))
         
         # Cria o dicionário da missão
         mission_dict = {
@@ -51,38 +91,290 @@ def dict_list_to_missions(data: list):
 
         # Recria a flight_path (LinkedList de DataPoints)
         for point_dict in mission_dict['flight_path']:
-            dp = DataPoint(point_dict['telemetry'], point_dict['environment'])
-            dp.timestamp = point_dict['timestamp']
-            mission.add_flight_point(dp)
+            mission.add_flight_point(dict_to_data_point(point_dict))
         
         missions_ll.append(mission)
     return missions_ll
 
 def save_missions(missions: LinkedList, filename: str):
-    """Salva a lista de missões completas em um arquivo JSON."""
+    """Salva a lista de missões completas em um arquivo JSON. Retorna True em caso de sucesso."""
     missions_data = missions_to_dict_list(missions)
     try:
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(missions_data, f, indent=4, ensure_ascii=False)
         print(f"Histórico de missões salvo em {filename}")
+        return True
     except IOError as e:
         print(f"Erro ao salvar o arquivo de histórico: {e}")
+        return False
+
+JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+def iter_json_array_file(filename: str, chunk_size: int = 1024 * 1024):
+    """
+    Lê e decodifica um arquivo com um array JSON elemento por elemento.
+    O arquivo é lido em blocos e a thread cede o GIL (time.sleep(0)) entre
+    blocos e entre elementos, de modo que um arquivo grande lido em segundo
+    plano não trava a thread principal como json.load faria.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    with open(filename, 'rb') as f:
+        buffer = ""
+        index = 0
+        eof = False
+
+        def read_more():
+            """Acrescenta o próximo bloco ao buffer, descartando o que já foi consumido."""
+            nonlocal buffer, index, eof
+            if eof:
+                raise json.JSONDecodeError("Fim inesperado do array", buffer, len(buffer))
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[index:] + utf8.decode(chunk, final=eof)
+            index = 0
+            time.sleep(0) # Cede o GIL para as demais threads
+
+        def next_char():
+            """Avança sobre espaços em branco e retorna o próximo caractere relevante."""
+            nonlocal index
+            while True:
+                index = JSON_WHITESPACE.match(buffer, index).end()
+                if index < len(buffer):
+                    return buffer[index]
+                read_more()
+
+        if next_char() != '[':
+            raise json.JSONDecodeError("Esperado '['", buffer, index)
+        index += 1
+        if next_char() == ']':
+            return
+
+        while True:
+            next_char()
+            while True:
+                try:
+                    element, end = decoder.raw_decode(buffer, index)
+                    # Um elemento que termina no fim do buffer pode estar incompleto
+                    if end < len(buffer) or eof:
+                        break
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                read_more()
+            index = end
+            yield element
+            time.sleep(0) # Cede o GIL para as demais threads
+
+            separator = next_char()
+            if separator == ']':
+                return
+            if separator != ',':
+                raise json.JSONDecodeError("Esperado ',' ou ']'", buffer, index)
+            index += 1
 
 def load_missions(filename: str):
-    """Carrega o histórico de missões de um arquivo JSON."""
+    """
+    Carrega o histórico de missões de um arquivo JSON.
+    As missões são lidas e decodificadas uma a uma (iter_json_array_file),
+    permitindo que o carregamento em segundo plano não trave a thread principal.
+    Uma única missão muito grande ainda é decodificada de uma só vez.
+    """
     if not os.path.exists(filename):
         return LinkedList() # Retorna uma lista vazia se o arquivo não existe
 
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
         # A conversão é feita do mais antigo para o mais novo
-        missions_ll = dict_list_to_missions(data)
+        missions_ll = dict_list_to_missions(iter_json_array_file(filename))
         print(f"Histórico de missões carregado de {filename}")
         return missions_ll
-    except (IOError, json.JSONDecodeError) as e:
+    except (IOError, UnicodeDecodeError, json.JSONDecodeError) as e:
         print(f"Erro ao carregar ou decodificar o arquivo de histórico: {e}")
         return LinkedList() # Retorna lista vazia em caso de erro
 
+# =============================================================================
+# CHECKPOINTS DA MISSÃO EM ANDAMENTO
+# =============================================================================
+# O arquivo de checkpoint é um JSON Lines: a primeira linha é o cabeçalho da
+# missão e cada linha seguinte é um incremento com o estado atual do drone e
+# apenas os pontos de voo coletados desde o checkpoint anterior. Assim, o custo
+# de cada checkpoint é proporcional aos dados novos, e não ao tamanho da missão.
+
+def checkpoint_header(mission: Mission, simulation_mode: str, map_seed: int):
+    """Monta o cabeçalho (primeira linha) do arquivo de checkpoint."""
+    return {
+        "mission_type": mission.mission_type,
+        "simulation_mode": simulation_mode,
+        "map_seed": map_seed,
+        "start_time": mission.start_time,
+        "initial_battery": mission.initial_battery
+    }
+
+def checkpoint_record(drone: Drone, auto_path_index: int, points):
+    """Monta um incremento do checkpoint com o estado do drone e os pontos informados."""
+    return {
+        "drone": drone_to_dict(drone),
+        "auto_path_index": auto_path_index,
+        "flight_path": [data_point_to_dict(point) for point in points]
+    }
+
+def start_checkpoint(filename: str, mission: Mission, simulation_mode: str, map_seed: int):
+    """Cria (ou sobrescreve) o arquivo de checkpoint com o cabeçalho da missão."""
+    header = checkpoint_header(mission, simulation_mode, map_seed)
+    try:
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(header, ensure_ascii=False) + "\n")
+    except IOError as e:
+        print(f"Erro ao criar o arquivo de checkpoint: {e}")
+
+def truncate_checkpoint_to_last_line(filename: str):
+    """
+    Descarta uma eventual linha incompleta no final do arquivo de checkpoint
+    (escrita interrompida), para que o próximo incremento não seja colado nela.
+    No caso comum apenas o último byte é lido.
+    """
+    with open(filename, 'rb+') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return
+
+        # Procura a última quebra de linha, em blocos, do final para o início
+        position = size
+        while position > 0:
+            block_size = min(4096, position)
+            position -= block_size
+            f.seek(position)
+            index = f.read(block_size).rfind(b"\n")
+            if index != -1:
+                f.truncate(position + index + 1)
+                return
+        f.truncate(0)
+
+def append_checkpoint(filename: str, drone: Drone, auto_path_index: int, new_points):
+    """
+    Acrescenta ao checkpoint o estado do drone e os novos pontos de voo.
+    Retorna True em caso de sucesso.
+    """
+    record = checkpoint_record(drone, auto_path_index, new_points)
+    try:
+        if os.path.exists(filename):
+            truncate_checkpoint_to_last_line(filename)
+        with open(filename, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return True
+    except IOError as e:
+        print(f"Erro ao salvar o checkpoint da missão: {e}")
+        return False
+
+def compact_checkpoint(filename: str, mission: Mission, simulation_mode: str, map_seed: int,
+                       drone: Drone, auto_path_index: int):
+    """
+    Reescreve o checkpoint com o cabeçalho e um único incremento contendo todos
+    os pontos da missão. O novo conteúdo é gravado em um arquivo temporário e
+    só então substitui o original, que permanece válido se a escrita falhar.
+    Retorna True em caso de sucesso.
+    """
+    temp_filename = filename + ".tmp"
+    header = checkpoint_header(mission, simulation_mode, map_seed)
+    record = checkpoint_record(drone, auto_path_index, mission.flight_path)
+    try:
+        with open(temp_filename, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(header, ensure_ascii=False) + "\n")
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(temp_filename, filename)
+        return True
+    except OSError as e:
+        print(f"Erro ao compactar o checkpoint da missão: {e}")
+        return False
+
+def load_checkpoint(filename: str):
+    """
+    Carrega uma missão interrompida a partir do arquivo de checkpoint.
+    Retorna um dicionário com a missão, o drone, o modo de simulação, a semente
+    do mapa e o índice do caminho automático, ou None se não houver o que retomar.
+    """
+    if not os.path.exists(filename):
+        return None
+
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+    except IOError as e:
+        print(f"Erro ao ler o arquivo de checkpoint: {e}")
+        return None
+
+    try:
+        header = json.loads(lines[0])
+    except (IndexError, json.JSONDecodeError):
+        return None
+
+    records = []
+    for line in lines[1:]:
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError:
+            break # Linha incompleta: o processo terminou durante a escrita
+    if not records:
+        return None
+
+    # Um cabeçalho ou incremento com formato inesperado é tratado como "nada a retomar"
+    try:
+        drone = dict_to_drone(records[-1]['drone'])
+        mission = Mission(header['mission_type'], drone)
+        mission.start_time = header['start_time']
+        mission.status = "Em andamento"
+        mission.initial_battery = header['initial_battery']
+        for record in records:
+            for point_dict in record['flight_path']:
+                mission.add_flight_point(dict_to_data_point(point_dict))
+
+        checkpoint = {
+            "mission": mission,
+            "drone": drone,
+            "simulation_mode": header['simulation_mode'],
+            "map_seed": header['map_seed'],
+            "auto_path_index": records[-1]['auto_path_index']
+        }
+    except (KeyError, TypeError, IndexError) as e:
+        print(f"Checkpoint inválido em {filename}, ignorando: {e}")
+        return None
+
+    print(f"Missão em andamento recuperada de {filename}")
+    return checkpoint
+
+def remove_checkpoint(filename: str):
+    """Remove o arquivo de checkpoint (missão concluída)."""
+    try:
+        if os.path.exists(filename):
+            os.remove(filename)
+    except OSError as e:
+        print(f"Erro ao remover o arquivo de checkpoint: {e}")
+
+# =============================================================================
+# CACHE DE FONTES
+# =============================================================================
+
+def load_font_cache(filename: str):
+    """Carrega o cache de caminhos de fontes resolvidas em execuções anteriores."""
+    if not os.path.exists(filename):
+        return {}
+
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (IOError, json.JSONDecodeError):
+        return {} # Cache inválido: as fontes serão resolvidas novamente
+
+def save_font_cache(font_cache: dict, filename: str):
+    """Salva o cache de caminhos de fontes em um arquivo JSON."""
+    try:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(font_cache, f, indent=4, ensure_ascii=False)
+    except IOError as e:
+        print(f"Erro ao salvar o cache de fontes: {e}")
+
 # --- END OF FILE gerenciador_dados.py ---
\ No newline at end of file
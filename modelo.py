@@ -11,15 +11,18 @@ from estruturas import LinkedList
 # =============================================================================
 
 class MapCell:
-    """Representa uma célula no mapa com suas características ambientais."""
-    def __init__(self):
-        self.area_type = random.choice(['Urbana', 'Residencial', 'Industrial', 'Rural', 'Mata', 'Zona de Risco'])
-        self.population_density = random.randint(50, 15000)  # hab/km²
-        self.green_area_percent = random.randint(0, 100) if self.area_type in ['Rural', 'Mata', 'Residencial'] else random.randint(0, 20)
-        self.air_pollution_index = random.randint(0, 300) # Valor do índice
-        self.has_tall_buildings = random.choice([True, False]) if self.area_type in ['Urbana', 'Industrial'] else False
-        self.gps_signal = random.choice(['Forte', 'Fraco', 'Perdido'])
-        self.noise_level = random.randint(30, 110) # dB
+    """
+    Representa uma célula no mapa com suas características ambientais.
+    O gerador `rng` permite recriar o mesmo mapa a partir de uma semente.
+    """
+    def __init__(self, rng=random):
+        self.area_type = rng.choice(['Urbana', 'Residencial', 'Industrial', 'Rural', 'Mata', 'Zona de Risco'])
+        self.population_density = rng.randint(50, 15000)  # hab/km²
+        self.green_area_percent = rng.randint(0, 100) if self.area_type in ['Rural', 'Mata', 'Residencial'] else rng.randint(0, 20)
+        self.air_pollution_index = rng.randint(0, 300) # Valor do índice
+        self.has_tall_buildings = rng.choice([True, False]) if self.area_type in ['Urbana', 'Industrial'] else False
+        self.gps_signal = rng.choice(['Forte', 'Fraco', 'Perdido'])
+        self.noise_level = rng.randint(30, 110) # dB
 
 class DataPoint:
     """Armazena todos os dados coletados em um único ponto de voo."""
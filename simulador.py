@@ -1,13 +1,22 @@
 # --- START OF FILE simulador.py ---
 
-import pygame
-import random
 import time
+IMPORT_START = time.perf_counter()
+
+import gc
+import os
+import random
+import threading
+import pygame
 # Importa as classes do nosso módulo de modelo
 from modelo import MapCell, Drone, Mission
 # Importa a estrutura de dados para o histórico de missões
 from estruturas import LinkedList
 from gerenciador_dados import save_missions, load_missions
+from gerenciador_dados import start_checkpoint, append_checkpoint, compact_checkpoint, load_checkpoint, remove_checkpoint
+from gerenciador_dados import load_font_cache, save_font_cache
+
+IMPORT_TIME = time.perf_counter() - IMPORT_START
 
 # =============================================================================
 # CLASSE PRINCIPAL DA SIMULAÇÃO (CONTROLADOR E VISÃO)
@@ -19,7 +28,15 @@ class Simulator:
     e o estado geral da aplicação.
     """
     def __init__(self):
-        pygame.init()
+        self.startup_start = time.perf_counter()
+        self.startup_times = [("importações", IMPORT_TIME)] # (etapa, segundos)
+        self.first_frame_drawn = False
+        self.startup_reported = False
+
+        # Inicializa apenas os subsistemas usados (pygame.init() também iniciaria áudio, joystick...)
+        phase_start = time.perf_counter()
+        pygame.display.init()
+        pygame.font.init()
         pygame.display.set_caption("Simulador de Missões de Drones")
         
         # Configurações do Mapa e Tela
@@ -29,6 +46,7 @@ class Simulator:
         self.SCREEN_WIDTH = self.GRID_WIDTH * self.CELL_SIZE + self.UI_WIDTH
         self.SCREEN_HEIGHT = self.GRID_HEIGHT * self.CELL_SIZE
         self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+        self.record_startup_time("display", phase_start)
 
         # Cores e Fontes
         self.COLORS = {
@@ -38,9 +56,13 @@ class Simulator:
             'background': (20, 20, 40), 'ui_text': (240, 240, 240),
             'drone': (255, 255, 0), 'path': (0, 191, 255, 150)
         }
-        self.FONT_S = pygame.font.SysFont("Consolas", 14)
-        self.FONT_M = pygame.font.SysFont("Consolas", 16, bold=True)
-        self.FONT_L = pygame.font.SysFont("Consolas", 20, bold=True)
+        phase_start = time.perf_counter()
+        self.FONT_CACHE_FILE = "font_cache.json"
+        self.font_cache = load_font_cache(self.FONT_CACHE_FILE)
+        self.FONT_S = self.load_font("Consolas", 14)
+        self.FONT_M = self.load_font("Consolas", 16, bold=True)
+        self.FONT_L = self.load_font("Consolas", 20, bold=True)
+        self.record_startup_time("fontes", phase_start)
         
         # Estado da Aplicação
         self.game_state = "MENU" # MENU, SIMULATING, STATS
@@ -49,13 +71,38 @@ class Simulator:
         self.clock = pygame.time.Clock()
         self.running = True
 
+        # Loop orientado a eventos: fora da simulação só redesenha quando necessário
+        self.IDLE_TIMEOUT_MS = 500
+        self.REDRAW_EVENTS = {pygame.VIDEOEXPOSE, pygame.VIDEORESIZE, pygame.ACTIVEEVENT}
+        if hasattr(pygame, "WINDOWEXPOSED"):
+            self.REDRAW_EVENTS.add(pygame.WINDOWEXPOSED)
+        self.needs_redraw = True
+        self.command_queue = LinkedList() # Fila de comandos (tuplas) a executar em lote
+        self.command_log = LinkedList() # Comandos executados na missão atual, para reexecução
+
+        # Checkpoints da missão em andamento (retomada após encerramento inesperado)
+        self.CHECKPOINT_FILE = "mission_checkpoint.jsonl"
+        self.CHECKPOINT_INTERVAL_MS = 5000
+        self.last_checkpoint_node = None # Último nó do flight_path já gravado
+        self.last_checkpoint_time = 0
+        checkpoint = load_checkpoint(self.CHECKPOINT_FILE)
+
         # Elementos da Simulação
-        self.map_grid = [[MapCell() for _ in range(self.GRID_WIDTH)] for _ in range(self.GRID_HEIGHT)]
+        # A semente permite recriar o mesmo mapa ao retomar uma missão
+        self.map_seed = checkpoint['map_seed'] if checkpoint else random.randrange(2**32)
+        # Ao retomar, o mapa é necessário de imediato (e é barato gerar a partir da semente)
+        self.map_grid = self.generate_map(self.map_seed) if checkpoint else None
         self.drone = Drone(self.GRID_WIDTH // 2, self.GRID_HEIGHT // 2)
         self.current_mission = None
         self.HISTORY_FILE = "missions_history.json"
-        # self.completed_missions = LinkedList()
-        self.completed_missions = load_missions(self.HISTORY_FILE)
+        self.completed_missions = LinkedList()
+
+        # Mapa e histórico são carregados em segundo plano com o menu já interativo
+        self.LOAD_DONE_EVENT = pygame.USEREVENT + 1
+        self.map_ready = threading.Event()
+        self.history_ready = threading.Event()
+        self.background_loader = threading.Thread(target=self.load_in_background, daemon=True)
+        self.background_loader.start()
         
         # Para modo automático
         self.auto_path = []
@@ -64,6 +111,86 @@ class Simulator:
 
         self.history_selected_index = 0
         self.history_scroll_offset = 0
+
+        if checkpoint:
+            self.resume_simulation(checkpoint)
+
+    def record_startup_time(self, label, phase_start):
+        """Registra a duração de uma etapa da inicialização."""
+        self.startup_times.append((label, time.perf_counter() - phase_start))
+
+    def report_startup_times(self):
+        """
+        Exibe o detalhamento do tempo de inicialização, uma única vez, quando o
+        primeiro quadro já foi desenhado e o carregamento em segundo plano terminou.
+        """
+        if self.startup_reported or not self.first_frame_drawn or not self.history_ready.is_set():
+            return
+        self.startup_reported = True
+        details = ", ".join(f"{label}: {seconds * 1000:.0f} ms" for label, seconds in self.startup_times)
+        print(f"Tempo de inicialização ({details})")
+
+    def load_font(self, name, size, bold=False):
+        """
+        Carrega uma fonte do sistema, equivalente a pygame.font.SysFont.
+        O caminho resolvido é guardado em cache entre execuções, evitando a
+        varredura de fontes do sistema (lenta) a cada inicialização.
+        """
+        key = f"{name}|{'bold' if bold else 'regular'}"
+        entry = self.font_cache.get(key)
+        if entry is None or entry['path'] is None or not os.path.exists(entry['path']):
+            path = pygame.font.match_font(name, bold=bold)
+            # Sem variante negrito instalada o SysFont aplica negrito sintético
+            synthetic_bold = bold and (path is None or path == pygame.font.match_font(name))
+            entry = {"path": path, "synthetic_bold": synthetic_bold}
+            # Buscas sem resultado não são guardadas: a fonte pode ser instalada depois
+            if path is not None:
+                self.font_cache[key] = entry
+                save_font_cache(self.font_cache, self.FONT_CACHE_FILE)
+
+        font = pygame.font.Font(entry['path'], size)
+        if entry['synthetic_bold']:
+            font.set_bold(True)
+        return font
+
+    def load_in_background(self):
+        """Gera o mapa e carrega o histórico de missões fora da thread principal."""
+        if self.map_grid is None:
+            phase_start = time.perf_counter()
+            self.map_grid = self.generate_map(self.map_seed)
+            self.record_startup_time("mapa (2º plano)", phase_start)
+        self.map_ready.set()
+
+        # Coletas completas do GC sobre os milhões de objetos recém-criados
+        # travariam a thread principal; elas ficam suspensas durante a carga e os
+        # objetos carregados são congelados para não serem varridos depois.
+        phase_start = time.perf_counter()
+        gc.disable()
+        try:
+            self.completed_missions = load_missions(self.HISTORY_FILE)
+        finally:
+            gc.freeze()
+            gc.enable()
+        self.record_startup_time("histórico (2º plano)", phase_start)
+        self.history_ready.set()
+
+        try:
+            pygame.event.post(pygame.event.Event(self.LOAD_DONE_EVENT))
+        except pygame.error:
+            pass # A janela foi fechada antes do fim do carregamento
+
+    def get_ticks(self):
+        """
+        Milissegundos de um relógio monotônico.
+        Substitui pygame.time.get_ticks(), que retorna 0 enquanto o timer do SDL
+        não é inicializado (não chamamos mais pygame.init()).
+        """
+        return int(time.monotonic() * 1000)
+
+    def generate_map(self, seed):
+        """Gera o grid de células do mapa de forma determinística a partir da semente."""
+        rng = random.Random(seed)
+        return [[MapCell(rng) for _ in range(self.GRID_WIDTH)] for _ in range(self.GRID_HEIGHT)]
         
     def generate_auto_path(self):
         """Gera um caminho simples (varredura) para o modo automático."""
@@ -79,9 +206,11 @@ class Simulator:
 
     def start_simulation(self):
         """Inicia uma nova simulação, resetando e configurando os elementos."""
+        self.map_ready.wait()
         self.drone = Drone(self.GRID_WIDTH // 2, self.GRID_HEIGHT // 2)
         self.current_mission = Mission(self.mission_type, self.drone)
         self.current_mission.start()
+        self.command_log = LinkedList()
         
         # Coleta o ponto inicial
         initial_cell = self.map_grid[self.drone.y][self.drone.x]
@@ -91,97 +220,234 @@ class Simulator:
         if self.simulation_mode == "Automatico":
             self.auto_path = self.generate_auto_path()
             self.auto_path_index = self.auto_path.index((self.drone.x, self.drone.y))
-            self.last_auto_move_time = pygame.time.get_ticks()
+            self.last_auto_move_time = self.get_ticks()
 
         self.game_state = "SIMULATING"
+
+        start_checkpoint(self.CHECKPOINT_FILE, self.current_mission, self.simulation_mode, self.map_seed)
+        self.last_checkpoint_node = None
+        self.save_checkpoint()
+
+    def resume_simulation(self, checkpoint):
+        """Retoma uma missão interrompida a partir dos dados do checkpoint."""
+        self.drone = checkpoint['drone']
+        self.current_mission = checkpoint['mission']
+        self.command_log = LinkedList()
+        self.mission_type = self.current_mission.mission_type
+        self.simulation_mode = checkpoint['simulation_mode']
+
+        if self.simulation_mode == "Automatico":
+            self.auto_path = self.generate_auto_path()
+            self.auto_path_index = checkpoint['auto_path_index']
+            self.last_auto_move_time = self.get_ticks()
+
+        self.game_state = "SIMULATING"
+
+        # Reescreve o checkpoint compactado, descartando uma eventual linha incompleta.
+        # Se a compactação falhar, o arquivo original continua intacto e a linha
+        # incompleta é descartada pelo próximo append_checkpoint.
+        compact_checkpoint(self.CHECKPOINT_FILE, self.current_mission, self.simulation_mode,
+                           self.map_seed, self.drone, self.auto_path_index)
+        self.last_checkpoint_node = self.current_mission.flight_path.tail
+        self.last_checkpoint_time = self.get_ticks()
+
+    def save_checkpoint(self):
+        """
+        Grava um checkpoint incremental: estado do drone e pontos novos desde o último.
+        Se a gravação falhar, o próximo checkpoint tenta novamente os mesmos pontos.
+        """
+        flight_path = self.current_mission.flight_path
+        new_points = flight_path.iter_after(self.last_checkpoint_node)
+        if append_checkpoint(self.CHECKPOINT_FILE, self.drone, self.auto_path_index, new_points):
+            self.last_checkpoint_node = flight_path.tail
+            self.last_checkpoint_time = self.get_ticks()
         
     def end_simulation(self):
         if self.current_mission:
             self.current_mission.end()
+            # O histórico precisa estar carregado antes que a missão seja salva nele
+            self.history_ready.wait()
             self.completed_missions.append(self.current_mission)
-            save_missions(self.completed_missions, self.HISTORY_FILE)
-            self.current_mission = None
+            # Sem salvar o histórico, o checkpoint é a única cópia da missão
+            if save_missions(self.completed_missions, self.HISTORY_FILE):
+                remove_checkpoint(self.CHECKPOINT_FILE)
             self.current_mission = None
+            self.last_checkpoint_node = None
         self.game_state = "STATS"
 
     def run(self):
-        """Loop principal da aplicação."""
+        """
+        Loop principal da aplicação.
+        Durante a simulação o loop roda em taxa fixa (30 FPS). Nas telas
+        estáticas (menu, ajuda, histórico, estatísticas) o loop fica bloqueado
+        em pygame.event.wait e só redesenha quando há entrada ou mudança de estado.
+        """
+        self.draw()
+        self.record_startup_time("primeiro quadro", self.startup_start)
+        self.first_frame_drawn = True
+        self.report_startup_times()
+
         while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(30) # Limita o FPS
+            if self.game_state == "SIMULATING":
+                self.handle_events(pygame.event.get())
+                self.update()
+                self.draw()
+                self.clock.tick(30) # Limita o FPS
+            else:
+                event = pygame.event.wait(self.IDLE_TIMEOUT_MS)
+                events = [] if event.type == pygame.NOEVENT else [event] + pygame.event.get()
+                self.handle_events(events)
+                self.update()
+                if self.needs_redraw:
+                    self.draw()
+                if self.game_state == "SIMULATING":
+                    # Evita que o primeiro passo da simulação conte o tempo ocioso
+                    self.clock.tick()
+
+        # Checkpoint final após todo o lote de comandos, para retomar na próxima execução
+        if self.game_state == "SIMULATING" and self.current_mission:
+            self.save_checkpoint()
         pygame.quit()
 
-    def handle_events(self):
-        """Processa todas as entradas do usuário (teclado, mouse, etc.)."""
-        for event in pygame.event.get():
+    def handle_events(self, events):
+        """
+        Traduz as entradas do usuário (teclado, janela, etc.) em comandos
+        e os enfileira. A execução acontece em lote em update().
+        """
+        for event in events:
             if event.type == pygame.QUIT:
-                self.running = False
-            
+                self.command_queue.append(("QUIT",))
+                continue
+
+            if event.type == self.LOAD_DONE_EVENT:
+                self.command_queue.append(("BACKGROUND_LOADED",))
+                continue
+
+            if event.type in self.REDRAW_EVENTS:
+                self.needs_redraw = True
+                continue
+
+            if event.type != pygame.KEYDOWN:
+                continue
+
             if self.game_state == "SIMULATING" and self.simulation_mode == "Manual":
-                if event.type == pygame.KEYDOWN:
-                    dx, dy = 0, 0
-                    if event.key == pygame.K_LEFT and self.drone.x > 0: dx = -1
-                    elif event.key == pygame.K_RIGHT and self.drone.x < self.GRID_WIDTH - 1: dx = 1
-                    elif event.key == pygame.K_UP and self.drone.y > 0: dy = -1
-                    elif event.key == pygame.K_DOWN and self.drone.y < self.GRID_HEIGHT - 1: dy = 1
-                    
-                    if dx != 0 or dy != 0:
-                        self.drone.move(dx, dy, self.CELL_SIZE)
-                        cell = self.map_grid[self.drone.y][self.drone.x]
-                        data_point = self.drone.collect_data(cell)
-                        self.current_mission.add_flight_point(data_point)
-                    
-                    if event.key == pygame.K_c:
-                        self.drone.toggle_camera()
-                    if event.key == pygame.K_p:
-                        self.drone.take_photo()
-                    if event.key == pygame.K_ESCAPE:
-                        self.end_simulation()
-            
+                if event.key == pygame.K_LEFT: self.command_queue.append(("MOVE", -1, 0))
+                elif event.key == pygame.K_RIGHT: self.command_queue.append(("MOVE", 1, 0))
+                elif event.key == pygame.K_UP: self.command_queue.append(("MOVE", 0, -1))
+                elif event.key == pygame.K_DOWN: self.command_queue.append(("MOVE", 0, 1))
+
+                if event.key == pygame.K_c: self.command_queue.append(("TOGGLE_CAMERA",))
+                if event.key == pygame.K_p: self.command_queue.append(("TAKE_PHOTO",))
+                if event.key == pygame.K_ESCAPE: self.command_queue.append(("END_MISSION",))
+
             elif self.game_state == "SIMULATING" and self.simulation_mode == "Automatico":
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        self.end_simulation()
+                if event.key == pygame.K_ESCAPE: self.command_queue.append(("END_MISSION",))
 
             elif self.game_state == "MENU":
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_1: self.simulation_mode = "Manual"
-                    if event.key == pygame.K_2: self.simulation_mode = "Automatico"
-                    if event.key == pygame.K_q: self.mission_type = "Monitoramento"
-                    if event.key == pygame.K_w: self.mission_type = "Entrega"
-                    if event.key == pygame.K_e: self.mission_type = "Vigilância"
-                    if event.key == pygame.K_m:
-                        self.history_selected_index = len(self.completed_missions) - 1 if not self.completed_missions.is_empty() else 0
-                        self.game_state = "HISTORY"
-                    if event.key == pygame.K_h:
-                        self.game_state = "HELP"
-                    if event.key == pygame.K_RETURN: self.start_simulation()
-            
+                if event.key == pygame.K_1: self.command_queue.append(("SET_MODE", "Manual"))
+                if event.key == pygame.K_2: self.command_queue.append(("SET_MODE", "Automatico"))
+                if event.key == pygame.K_q: self.command_queue.append(("SET_MISSION_TYPE", "Monitoramento"))
+                if event.key == pygame.K_w: self.command_queue.append(("SET_MISSION_TYPE", "Entrega"))
+                if event.key == pygame.K_e: self.command_queue.append(("SET_MISSION_TYPE", "Vigilância"))
+                if event.key == pygame.K_m: self.command_queue.append(("OPEN_HISTORY",))
+                if event.key == pygame.K_h: self.command_queue.append(("OPEN_HELP",))
+                if event.key == pygame.K_RETURN: self.command_queue.append(("START_MISSION",))
+
             elif self.game_state == "STATS":
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN or event.key == pygame.K_ESCAPE:
-                        self.game_state = "MENU"
+                if event.key == pygame.K_RETURN or event.key == pygame.K_ESCAPE:
+                    self.command_queue.append(("BACK_TO_MENU",))
 
             elif self.game_state == "HISTORY":
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        self.game_state = "MENU"
-                    if not self.completed_missions.is_empty():
-                        if event.key == pygame.K_UP:
-                            self.history_selected_index = max(0, self.history_selected_index - 1)
-                        elif event.key == pygame.K_DOWN:
-                            self.history_selected_index = min(len(self.completed_missions) - 1, self.history_selected_index + 1)
+                if event.key == pygame.K_ESCAPE: self.command_queue.append(("BACK_TO_MENU",))
+                if event.key == pygame.K_UP: self.command_queue.append(("HISTORY_SCROLL", -1))
+                elif event.key == pygame.K_DOWN: self.command_queue.append(("HISTORY_SCROLL", 1))
 
             elif self.game_state == "HELP":
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        self.game_state = "MENU"
+                if event.key == pygame.K_ESCAPE: self.command_queue.append(("BACK_TO_MENU",))
+
+    def execute_command(self, command):
+        """
+        Aplica um único comando ao estado da simulação.
+        Comandos são tuplas (nome, *argumentos), o que permite gerá-los tanto a
+        partir da entrada do usuário quanto da lógica do modo automático; eles
+        comandos da missão atual ficam registrados em self.command_log e podem ser
+        reexecutados com replay_commands(). Comandos que não fazem sentido no
+        estado atual são ignorados.
+        """
+        name = command[0]
+
+        if name == "QUIT":
+            self.running = False
+
+        elif name == "BACKGROUND_LOADED":
+            self.report_startup_times()
+            if self.game_state == "HISTORY":
+                self.history_selected_index = len(self.completed_missions) - 1 if not self.completed_missions.is_empty() else 0
+
+        elif self.game_state == "SIMULATING":
+            # Apenas comandos da missão são registrados; o log é reiniciado a cada missão
+            self.command_log.append(command)
 
+        if self.game_state == "SIMULATING":
+            if name == "MOVE":
+                dx, dy = command[1], command[2]
+                new_x, new_y = self.drone.x + dx, self.drone.y + dy
+                if 0 <= new_x < self.GRID_WIDTH and 0 <= new_y < self.GRID_HEIGHT:
+                    self.drone.move(dx, dy, self.CELL_SIZE)
+                    cell = self.map_grid[self.drone.y][self.drone.x]
+                    data_point = self.drone.collect_data(cell)
+                    self.current_mission.add_flight_point(data_point)
+            elif name == "TOGGLE_CAMERA":
+                self.drone.toggle_camera()
+            elif name == "TAKE_PHOTO":
+                self.drone.take_photo()
+            elif name == "END_MISSION":
+                self.end_simulation()
+
+        elif self.game_state == "MENU":
+            if name == "SET_MODE":
+                self.simulation_mode = command[1]
+            elif name == "SET_MISSION_TYPE":
+                self.mission_type = command[1]
+            elif name == "OPEN_HISTORY":
+                self.history_selected_index = len(self.completed_missions) - 1 if not self.completed_missions.is_empty() else 0
+                self.game_state = "HISTORY"
+            elif name == "OPEN_HELP":
+                self.game_state = "HELP"
+            elif name == "START_MISSION":
+                self.start_simulation()
+
+        elif self.game_state == "HISTORY":
+            if name == "BACK_TO_MENU":
+                self.game_state = "MENU"
+            elif name == "HISTORY_SCROLL" and not self.completed_missions.is_empty():
+                self.history_selected_index = min(len(self.completed_missions) - 1, max(0, self.history_selected_index + command[1]))
+
+        elif self.game_state in ("STATS", "HELP"):
+            if name == "BACK_TO_MENU":
+                self.game_state = "MENU"
+
+        self.needs_redraw = True
+
+    def process_commands(self):
+        """Executa, em ordem, todos os comandos acumulados na fila."""
+        while not self.command_queue.is_empty():
+            self.execute_command(self.command_queue.pop_front())
+
+    def replay_commands(self, commands):
+        """
+        Reexecuta, em lote, uma sequência de comandos (ex: self.command_log).
+        Os comandos são enfileirados antes de executados, então é seguro
+        reexecutar o próprio log, que cresce durante a execução.
+        """
+        for command in commands:
+            self.command_queue.append(command)
+        self.process_commands()
 
     def update(self):
         """Atualiza a lógica do jogo (ex: movimento automático do drone)."""
+        self.process_commands()
+
         if self.game_state == "SIMULATING":
             # Condição para fim de missão
             if self.drone.battery <= 0:
@@ -189,7 +455,7 @@ class Simulator:
                 return
 
             if self.simulation_mode == "Automatico":
-                current_time = pygame.time.get_ticks()
+                current_time = self.get_ticks()
                 if current_time - self.last_auto_move_time > 200: # Move a cada 200ms
                     self.last_auto_move_time = current_time
                     self.auto_path_index += 1
@@ -197,18 +463,20 @@ class Simulator:
                         next_pos = self.auto_path[self.auto_path_index]
                         dx = next_pos[0] - self.drone.x
                         dy = next_pos[1] - self.drone.y
-                        
-                        self.drone.move(dx, dy, self.CELL_SIZE)
-                        cell = self.map_grid[self.drone.y][self.drone.x]
-                        data_point = self.drone.collect_data(cell)
-                        self.current_mission.add_flight_point(data_point)
-                        
+                        self.command_queue.append(("MOVE", dx, dy))
+
                         # Simula ações automáticas baseadas na missão
                         if self.mission_type == "Vigilância" and random.random() < 0.1:
-                            self.drone.take_photo()
+                            self.command_queue.append(("TAKE_PHOTO",))
 
                     else: # Fim do caminho
-                        self.end_simulation()
+                        self.command_queue.append(("END_MISSION",))
+
+                    self.process_commands()
+
+        if self.game_state == "SIMULATING" and self.running:
+            if self.get_ticks() - self.last_checkpoint_time >= self.CHECKPOINT_INTERVAL_MS:
+                self.save_checkpoint()
 
     # MÉTODOS DE DESENHO (VISÃO)
     def draw_text(self, text, font, color, x, y, center=False):
@@ -312,6 +580,10 @@ class Simulator:
         self.draw_text("Use as setas CIMA/BAIXO para navegar. Pressione ESC para voltar.", self.FONT_S, (200, 200, 200), self.SCREEN_WIDTH/2, y_pos, center=True)
         y_pos += 50
         
+        if not self.history_ready.is_set():
+            self.draw_text("Carregando histórico...", self.FONT_M, self.COLORS['ui_text'], self.SCREEN_WIDTH/2, y_pos, center=True)
+            return
+
         if not missions_list:
             self.draw_text("Nenhuma missão no histórico.", self.FONT_M, self.COLORS['ui_text'], self.SCREEN_WIDTH/2, y_pos, center=True)
             return
@@ -404,5 +676,6 @@ class Simulator:
             self.draw_help()
             
         pygame.display.flip()
+        self.needs_redraw = False
         
 # --- END OF FILE simulador.py ---
\ No newline at end of file